@@ -21,9 +21,9 @@ class WeightedDL(TfmdDL):
         self.wgts = wgts/wgts.sum()
 
     def get_idxs(self):
-        if self.n==0: return []
+        if self.n==0: return np.zeros(0, dtype=np.int64)
         if not self.shuffle: return super().get_idxs()
-        return list(np.random.choice(self.n, self.n, p=self.wgts))
+        return self.np_rng().choice(self.n, self.n, p=self.wgts).astype(np.int64)
 
 #Cell
 @patch
@@ -69,14 +69,15 @@ class EarlyStoppingCallback(TrackerCallback):
 #Cell
 class SaveModelCallback(TrackerCallback):
     "A `TrackerCallback` that saves the model's best during training and loads it at the end."
-    def __init__(self, monitor='valid_loss', comp=None, min_delta=0., fname='model', every_epoch=False, add_save=None, with_opt=False):
+    def __init__(self, monitor='valid_loss', comp=None, min_delta=0., fname='model', every_epoch=False, add_save=None, with_opt=False,
+                 with_dl=False):
         super().__init__(monitor=monitor, comp=comp, min_delta=min_delta)
-        store_attr(self, 'fname,every_epoch,add_save,with_opt')
+        store_attr(self, 'fname,every_epoch,add_save,with_opt,with_dl')
 
     def _save(self, name):
-        self.learn.save(name, with_opt=self.with_opt)
+        self.learn.save(name, with_opt=self.with_opt, with_dl=self.with_dl)
         if self.add_save is not None:
-            with self.add_save.open('wb') as f: self.learn.save(f, with_opt=self.with_opt)
+            with self.add_save.open('wb') as f: self.learn.save(f, with_opt=self.with_opt, with_dl=self.with_dl)
 
     def after_epoch(self):
         "Compare the value monitored to its best score and save if best."
@@ -64,10 +64,11 @@ class _TypeDict:
 #Cell
 class TypeDispatch:
     "Dictionary-like object; `__getitem__` matches keys of types using `issubclass`"
+    # Incremented each time a function is added to any `TypeDispatch`, to invalidate caches of resolved functions
+    _version = 0
     def __init__(self, *funcs):
-        self.funcs = _TypeDict()
+        self.funcs,self.cache,self.bound,self._ref = _TypeDict(),{},{},None
         for o in funcs: self.add(o)
-        self.inst = None
 
     def add(self, f):
         "Add type `t` and function `f`"
@@ -77,6 +78,9 @@ class TypeDispatch:
             t = _TypeDict()
             self.funcs.add(a0, t)
         t.add(a1, f)
+        # Cleared in place since it is shared with the copies bound to an instance
+        self.cache.clear()
+        TypeDispatch._version += 1
 
     def first(self): return self.funcs.first().first()
     def returns(self, x): return anno_ret(self[type(x)])
@@ -91,26 +95,43 @@ class TypeDispatch:
         return '\n'.join(r)
 
     def __call__(self, *args, **kwargs):
-        ts = L(args).map(type)[:2]
-        f = self[tuple(ts)]
-        if not f: return args[0]
-        if self.inst is not None: f = types.MethodType(f, self.inst)
-        return f(*args, **kwargs)
+        k = (type(args[0]),type(args[1])) if len(args)>1 else (type(args[0]),object)
+        try: f = self.cache[k]
+        except KeyError: f = self._lookup(k)
+        if f is None: return args[0]
+        return f(*args, **kwargs) if self._ref is None else f(self._ref(), *args, **kwargs)
+
+    @property
+    def inst(self): return None if self._ref is None else self._ref()
 
     def __get__(self, inst, owner):
-        self.inst = inst
-        return self
+        if inst is None: return self
+        res = self.bound.get(id(inst))
+        return res if res is not None and res._ref() is inst else self._bind(inst)
+
+    def _bind(self, inst):
+        # A copy bound to `inst`, sharing `funcs` and `cache`, so that the dispatcher itself is never modified.
+        # It only keeps a weak reference to `inst`, so it can be cached in `bound` until `inst` is deleted.
+        res = object.__new__(type(self))
+        res.__dict__.update(self.__dict__)
+        k,bound = id(inst),self.bound
+        try: res._ref = weakref.ref(inst, lambda _: bound.pop(k, None))
+        except TypeError: res._ref = lambda: inst
+        else: bound[k] = res
+        return res
+
+    def __getstate__(self): return {**self.__dict__, 'bound':{}, '_ref':None}
+
+    def _lookup(self, k):
+        r = self.funcs.all_matches(k[0])
+        self.cache[k] = res = next((o for o in (t[k[1]] for t in r) if o is not None), None)
+        return res
 
     def __getitem__(self, k):
         "Find first matching type that is a super-class of `k`"
-        k = L(k if isinstance(k, tuple) else (k,))
-        while len(k)<2: k.append(object)
-        r = self.funcs.all_matches(k[0])
-        if len(r)==0: return None
-        for t in r:
-            o = t[k[1]]
-            if o is not None: return o
-        return None
+        k = ((k if isinstance(k, tuple) else (k,))+(object,object))[:2]
+        try: return self.cache[k]
+        except KeyError: return self._lookup(k)
 
 #Cell
 class DispatchReg:
@@ -2,8 +2,8 @@
 
 __all__ = ['defaults', 'FixSigMeta', 'PrePostInitMeta', 'NewChkMeta', 'BypassNewMeta', 'copy_func', 'patch_to', 'patch',
            'patch_property', 'use_kwargs', 'delegates', 'funcs_kwargs', 'method', 'add_docs', 'docs', 'custom_dir',
-           'arg0', 'arg1', 'arg2', 'arg3', 'arg4', 'bind', 'GetAttr', 'delegate_attr', 'coll_repr', 'mask2idxs',
-           'listable_types', 'CollBase', 'cycle', 'zip_cycle', 'is_indexer', 'negate_func', 'L']
+           'arg0', 'arg1', 'arg2', 'arg3', 'arg4', 'bind', 'GetAttr', 'delegate_attr', 'StrArray', 'coll_repr',
+           'mask2idxs', 'listable_types', 'CollBase', 'cycle', 'zip_cycle', 'is_indexer', 'negate_func', 'L']
 
 #Cell
 from ..test import *
@@ -72,6 +72,9 @@ def patch_to(cls, as_prop=False):
             for o in functools.WRAPPER_ASSIGNMENTS: setattr(nf, o, getattr(f,o))
             nf.__qualname__ = f"{c_.__name__}.{f.__name__}"
             setattr(c_, f.__name__, property(nf) if as_prop else nf)
+        # What `GetAttr` cached about the attributes of classes may have changed
+        _plain_attrs.cache_clear()
+        GetAttr._n_patches += 1
         return f
     return _inner
 
@@ -195,17 +198,38 @@ class bind:
         return self.fn(*fargs, **kwargs)
 
 #Cell
+@functools.lru_cache(maxsize=None)
+def _plain_attrs(cls):
+    "Whether the attributes of instances of `cls` are exactly the ones `dir` lists"
+    return not hasattr(cls, '__getattr__') and cls.__dir__ is object.__dir__
+
 class GetAttr:
     "Inherit from this to have all attr accesses in `self._xtra` passed down to `self.default`"
-    _default='default'
+    _default,_n_patches = 'default',0
     @property
     def _xtra(self): return self._dir()
     def _dir(self): return [o for o in dir(getattr(self,self._default)) if not o.startswith('_')]
     def __getattr__(self,k):
-        if k not in ('_xtra',self._default) and (self._xtra is None or k in self._xtra):
-            return getattr(getattr(self,self._default), k)
+        if k not in ('_xtra',self._default):
+            if type(self)._xtra is not GetAttr._xtra:
+                if self._xtra is None or k in self._xtra: return getattr(getattr(self,self._default), k)
+            elif not k.startswith('_'):
+                d = getattr(self,self._default)
+                if type(self)._dir is GetAttr._dir and _plain_attrs(type(d)):
+                    try: return getattr(d, k)
+                    except AttributeError: raise AttributeError(k) from None
+                if k in self._cached_dir(d, k): return getattr(d, k)
         raise AttributeError(k)
+
+    def _cached_dir(self, d, k):
+        "`self._dir()`, only computed again when the default object changed, a class was patched, or `d` has `k` but it wasn't listed"
+        c = self.__dict__.get('_xtra_cache')
+        if c is None or c[0] is not d or c[1]!=GetAttr._n_patches or (k not in c[2] and hasattr(d, k)):
+            c = self.__dict__['_xtra_cache'] = (d,GetAttr._n_patches,set(self._dir()))
+        return c[2]
+
     def __dir__(self): return custom_dir(self, self._dir() if self._xtra is None else self._dir())
+    def __getstate__(self): return {k:v for k,v in self.__dict__.items() if k!='_xtra_cache'}
     def __setstate__(self,data): self.__dict__.update(data)
 
 #Cell
@@ -216,7 +240,54 @@ def delegate_attr(self, k, to):
     except AttributeError: raise AttributeError(k) from None
 
 #Cell
-def _is_array(x): return hasattr(x,'__array__') or hasattr(x,'iloc')
+class StrArray:
+    "Read-only array of `cls` items (default `str`, or `Path`) stored as one UTF-8 buffer plus offsets"
+    def __init__(self, items=None, cls=None, buf=None, offs=None):
+        if buf is None:
+            items = [] if items is None else list(items)
+            if cls is None: cls = Path if len(items) and isinstance(items[0], Path) else str
+            enc = [str(o).encode() for o in items]
+            offs = np.zeros(len(enc)+1, dtype=np.int64)
+            if enc: np.cumsum([len(o) for o in enc], out=offs[1:])
+            buf = np.frombuffer(b''.join(enc), dtype=np.uint8)
+        self.buf,self.offs,self.cls = buf,offs,(str if cls is None else cls)
+
+    def __len__(self): return len(self.offs)-1
+    def _item(self, i):
+        if i<0: i += len(self)
+        if not 0<=i<len(self): raise IndexError(f"StrArray index {i} out of range")
+        return self.cls(self.buf[self.offs[i]:self.offs[i+1]].tobytes().decode())
+
+    def _take(self, idxs):
+        idxs = np.array(idxs, dtype=np.int64).reshape(-1)
+        idxs[idxs<0] += len(self)
+        starts = self.offs[idxs]
+        lens = self.offs[idxs+1]-starts
+        offs = np.zeros(len(idxs)+1, dtype=np.int64)
+        np.cumsum(lens, out=offs[1:])
+        pos = np.arange(offs[-1]) + np.repeat(starts-offs[:-1], lens)
+        return StrArray(cls=self.cls, buf=self.buf[pos], offs=offs)
+
+    def __getitem__(self, idx):
+        if is_indexer(idx): return self._item(int(idx))
+        if isinstance(idx, slice):
+            start,stop,step = idx.indices(len(self))
+            if step!=1: return self._take(range(start,stop,step))
+            return StrArray(cls=self.cls, buf=self.buf, offs=self.offs[start:max(start,stop)+1])
+        return self._take(mask2idxs(idx))
+
+    def __iter__(self): return (self._item(i) for i in range(len(self)))
+    def __add__(self, b): return list(self)+list(b)
+    def __repr__(self): return coll_repr(self)
+    def copy(self): return self
+    @property
+    def nbytes(self): return self.buf.nbytes + self.offs.nbytes
+
+#Cell
+add_docs(StrArray, copy="Return `self`, since a `StrArray` is never modified in place")
+
+#Cell
+def _is_array(x): return hasattr(x,'__array__') or hasattr(x,'iloc') or isinstance(x,StrArray)
 
 def _listify(o):
     if o is None: return []
@@ -235,6 +306,8 @@ def coll_repr(c, max_n=10):
 def mask2idxs(mask):
     "Convert bool mask or index list to index `L`"
     if isinstance(mask,slice): return mask
+    if isinstance(mask,ndarray) and mask.dtype.kind in 'biu':
+        return (mask.nonzero()[0] if mask.dtype==np.bool_ else mask.reshape(-1)).tolist()
     mask = list(mask)
     if len(mask)==0: return []
     it = mask[0]
@@ -301,9 +374,11 @@ class L(CollBase, metaclass=NewChkMeta):
 
     def _get(self, i):
         if is_indexer(i) or isinstance(i,slice): return getattr(self.items,'iloc',self.items)[i]
+        if isinstance(i,ndarray) and isinstance(self.items,ndarray): return self.items[i]
         i = mask2idxs(i)
         return (self.items.iloc[list(i)] if hasattr(self.items,'iloc')
                 else self.items.__array__()[(i,)] if hasattr(self.items,'__array__')
+                else self.items[i] if isinstance(self.items,StrArray)
                 else [self.items[i_] for i_ in i])
 
     def __setitem__(self, idx, o):
@@ -339,25 +414,39 @@ class L(CollBase, metaclass=NewChkMeta):
         return cls(range(a,b,step) if step is not None else range(a,b) if b is not None else range(a))
 
     def map(self, f, *args, **kwargs):
+        if isinstance(f,np.ufunc) and isinstance(self.items,ndarray): return self._new(f(self.items, *args, **kwargs))
         g = (bind(f,*args,**kwargs) if callable(f)
              else f.format if isinstance(f,str)
              else f.__getitem__)
         return self._new(map(g, self))
 
     def filter(self, f, negate=False, **kwargs):
+        if isinstance(f,np.ufunc) and isinstance(self.items,ndarray):
+            m = f(self.items, **kwargs).astype(bool)
+            return self._new(self.items[~m if negate else m])
         if kwargs: f = partial(f,**kwargs)
         if negate: f = negate_func(f)
         return self._new(filter(f, self))
 
-    def unique(self): return L(dict.fromkeys(self).keys())
+    def unique(self):
+        if isinstance(self.items,ndarray) and self.items.ndim==1 and self.items.dtype.kind!='O':
+            return L(self.items[np.sort(np.unique(self.items, return_index=True)[1])], use_list=None)
+        return L(dict.fromkeys(self).keys())
+
     def enumerate(self): return L(enumerate(self))
     def val2idx(self): return {v:k for k,v in self.enumerate()}
     def itemgot(self, *idxs):
+        if isinstance(self.items,ndarray) and self.items.ndim>len(idxs) and all(map(is_indexer,idxs)):
+            return self._new(self.items[(slice(None),*idxs)])
         x = self
         for idx in idxs: x = x.map(itemgetter(idx))
         return x
 
-    def attrgot(self, k, default=None): return self.map(lambda o:getattr(o,k,default))
+    def attrgot(self, k, default=None):
+        if hasattr(self.items,'iloc') and k in getattr(self.items,'columns',()): return self._new(self.items[k].values)
+        if k in (getattr(getattr(self.items,'dtype',None),'names',None) or ()): return self._new(self.items[k])
+        return self.map(lambda o:getattr(o,k,default))
+
     def cycle(self): return cycle(self)
     def map_dict(self, f=noop, *args, **kwargs): return {k:f(k, *args,**kwargs) for k in self}
     def starmap(self, f, *args, **kwargs): return self._new(itertools.starmap(partial(f,*args,**kwargs), self))
@@ -365,8 +454,11 @@ class L(CollBase, metaclass=NewChkMeta):
     def zipwith(self, *rest, cycled=False): return self._new([self, *rest]).zip(cycled=cycled)
     def map_zip(self, f, *args, cycled=False, **kwargs): return self.zip(cycled=cycled).starmap(f, *args, **kwargs)
     def map_zipwith(self, f, *rest, cycled=False, **kwargs): return self.zipwith(*rest, cycled=cycled).starmap(f, **kwargs)
-    def concat(self): return self._new(itertools.chain.from_iterable(self.map(L)))
+    def concat(self):
+        if isinstance(self.items,ndarray) and self.items.ndim>1: return self._new(np.concatenate(self.items))
+        return self._new(itertools.chain.from_iterable(self.map(L)))
     def shuffle(self):
+        if isinstance(self.items,StrArray): return self._new(self.items[np.random.permutation(len(self))])
         it = copy(self.items)
         random.shuffle(it)
         return self._new(it)
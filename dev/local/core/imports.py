@@ -1,6 +1,6 @@
-import io,operator,sys,os,re,os,mimetypes,csv,itertools,json,shutil,glob,pickle,tarfile,collections
-import hashlib,itertools,types,random,inspect,functools,random,time,math,bz2,types,typing,numbers,string
-import multiprocessing,threading,urllib,ipykernel,tempfile,concurrent.futures,matplotlib,warnings
+import io,operator,sys,os,re,os,mimetypes,csv,itertools,json,shutil,glob,pickle,tarfile,collections,queue
+import hashlib,itertools,types,weakref,random,inspect,functools,random,time,math,bz2,types,typing,numbers,string
+import multiprocessing,threading,urllib,tempfile,concurrent.futures,warnings,subprocess,importlib,importlib.abc
 
 from concurrent.futures import as_completed
 from functools import partial,reduce
@@ -20,12 +20,64 @@ from textwrap import TextWrapper
 from operator import itemgetter,attrgetter,methodcaller
 from urllib.request import urlopen
 
+_import_hooks = defaultdict(list)
+class _HookLoader(importlib.abc.Loader):
+    "Wraps `loader` to call the hooks registered for `name` once the module is executed"
+    def __init__(self, loader, name): self.loader,self.name = loader,name
+    def __getattr__(self, k): return getattr(self.loader, k)
+    def create_module(self, spec): return self.loader.create_module(spec)
+    def exec_module(self, module):
+        self.loader.exec_module(module)
+        for f in _import_hooks.pop(self.name, []): f(module)
+
+class _HookFinder(importlib.abc.MetaPathFinder):
+    "Meta path finder that wraps the loader of modules with hooks registered with `on_import`"
+    def find_spec(self, name, path, target=None):
+        if name not in _import_hooks: return None
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, 'find_spec'): continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None and spec.loader is not None:
+                spec.loader = _HookLoader(spec.loader, name)
+                return spec
+        return None
+
+def on_import(name, f):
+    "Call `f` on module `name` now if it's already imported, or as soon as it is"
+    if name in sys.modules: return f(sys.modules[name])
+    if not any(isinstance(o, _HookFinder) for o in sys.meta_path): sys.meta_path.insert(0, _HookFinder())
+    _import_hooks[name].append(f)
+
+class _LazyModule(types.ModuleType):
+    "Stand-in for module `name`, which is only imported on first attribute access"
+    def __getattr__(self, k):
+        mod = importlib.import_module(self.__name__)
+        self.__dict__.update(mod.__dict__)
+        try: return getattr(mod, k)
+        except AttributeError: pass
+        try: return importlib.import_module(f'{self.__name__}.{k}')
+        except ModuleNotFoundError: raise AttributeError(f"module '{self.__name__}' has no attribute '{k}'") from None
+
+def lazy_import(name):
+    "Module `name` if it's already imported, or a stand-in that imports it on first use"
+    return sys.modules.get(name) or _LazyModule(name)
+
 # External modules
-import requests,yaml,matplotlib.pyplot as plt,numpy as np,pandas as pd,scipy
-from pandas.api.types import is_categorical_dtype,is_numeric_dtype
+import numpy as np
 from numpy import array,ndarray
-from scipy import ndimage
-from IPython.core.debugger import set_trace
+
+# Heavy external modules are only imported on first use
+plt,pd,scipy,ndimage = map(lazy_import, ['matplotlib.pyplot', 'pandas', 'scipy', 'scipy.ndimage'])
+matplotlib,requests,yaml,ipykernel = map(lazy_import, ['matplotlib', 'requests', 'yaml', 'ipykernel'])
+skm,spacy,kornia,skimage = map(lazy_import, ['sklearn.metrics', 'spacy', 'kornia', 'skimage'])
+
+def is_categorical_dtype(arr_or_dtype): return pd.api.types.is_categorical_dtype(arr_or_dtype)
+def is_numeric_dtype(arr_or_dtype): return pd.api.types.is_numeric_dtype(arr_or_dtype)
+
+def set_trace(frame=None):
+    "IPython's `set_trace`, imported on first call"
+    from IPython.core.debugger import set_trace
+    set_trace(frame or sys._getframe().f_back)
 
 try:
     from types import WrapperDescriptorType,MethodWrapperType,MethodDescriptorType
@@ -35,7 +87,8 @@ except ImportError:
     MethodDescriptorType = type(str.join)
 from types import BuiltinFunctionType,BuiltinMethodType,MethodType,FunctionType
 
-pd.options.display.max_colwidth = 600
+def _pd_options(pd): pd.options.display.max_colwidth = 600
+on_import('pandas', _pd_options)
 NoneType = type(None)
 string_classes = (str,bytes)
 
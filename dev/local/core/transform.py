@@ -1,8 +1,8 @@
 #AUTOGENERATED! DO NOT EDIT! File to edit: dev/01c_core_transform.ipynb (unless otherwise specified).
 
-__all__ = ['ArrayBase', 'ArrayImageBase', 'ArrayImage', 'ArrayImageBW', 'ArrayMask', 'Transform', 'InplaceTransform',
-           'TupleTransform', 'ItemTransform', 'get_func', 'Func', 'Sig', 'compose_tfms', 'mk_transform', 'gather_attrs',
-           'gather_attr_names', 'Pipeline']
+__all__ = ['ArrayBase', 'ArrayImageBase', 'ArrayImage', 'ArrayImageBW', 'ArrayMask', 'deterministic', 'Transform',
+           'InplaceTransform', 'TupleTransform', 'ItemTransform', 'get_func', 'Func', 'Sig', 'compose_tfms',
+           'mk_transform', 'gather_attrs', 'gather_attr_names', 'Pipeline']
 
 #Cell
 from .imports import *
@@ -64,10 +64,18 @@ class _TfmMeta(type):
     @classmethod
     def __prepare__(cls, name, bases): return _TfmDict()
 
+#Cell
+def deterministic(f):
+    "Decorator to mark `f` as always returning the same output for the same input"
+    f.deterministic = True
+    return f
+
+def _is_det(f): return getattr(f, 'deterministic', f is noop or isinstance(f, (itemgetter,attrgetter)))
+
 #Cell
 class Transform(metaclass=_TfmMeta):
     "Delegates (`__call__`,`decode`,`setup`) to (`encodes`,`decodes`,`setups`) if `split_idx` matches"
-    split_idx,init_enc,as_item_force,as_item,order = None,False,None,True,0
+    split_idx,init_enc,as_item_force,as_item,order,deterministic = None,False,None,True,0,False
     def __init__(self, enc=None, dec=None, split_idx=None, as_item=False, order=None):
         self.split_idx,self.as_item = ifnone(split_idx, self.split_idx),as_item
         if order is not None: self.order=order
@@ -80,6 +88,7 @@ class Transform(metaclass=_TfmMeta):
         if enc:
             self.encodes.add(enc)
             self.order = getattr(enc,'order',self.order)
+            self.deterministic = _is_det(enc)
         if dec: self.decodes.add(dec)
 
     @property
@@ -87,6 +96,7 @@ class Transform(metaclass=_TfmMeta):
     def __call__(self, x, **kwargs): return self._call('encodes', x, **kwargs)
     def decode  (self, x, **kwargs): return self._call('decodes', x, **kwargs)
     def setup(self, items=None): return self.setups(items)
+    def encode_items(self, xs, **kwargs): return [self(x, **kwargs) for x in xs]
     def __repr__(self): return f'{self.__class__.__name__}: {self.use_as_item} {self.encodes} {self.decodes}'
 
     def _call(self, fn, x, split_idx=None, **kwargs):
@@ -99,7 +109,8 @@ class Transform(metaclass=_TfmMeta):
     def _do_call(self, f, x, **kwargs):
         return x if f is None else retain_type(f(x, **kwargs), x, f.returns_none(x))
 
-add_docs(Transform, decode="Delegate to `decodes` to undo transform", setup="Delegate to `setups` to set up transform")
+add_docs(Transform, decode="Delegate to `decodes` to undo transform", setup="Delegate to `setups` to set up transform",
+         encode_items="Call `self` on each item of `xs` (override to process all of them at once)")
 
 #Cell
 class InplaceTransform(Transform):
@@ -169,11 +180,72 @@ def gather_attr_names(o, nm):
     "Used in __dir__ to collect all attrs `k` from `self.{nm}`"
     return L(getattr(o,nm)).map(dir).concat().unique()
 
+#Cell
+def _is_plain(t):
+    "Whether `t` is called with the default logic of `Transform`, so that its calls can be compiled"
+    c = type(t)
+    return (isinstance(t, Transform) and c.__call__ is Transform.__call__ and c._call is Transform._call
+            and c._do_call is Transform._do_call and c.use_as_item is Transform.use_as_item)
+
+class _TfmStep():
+    "Call `t` on an item with the function `encodes` dispatches to (and whether to retain its type) cached per input type"
+    def __init__(self, t): self.t,self.plain,self.cache = t,_is_plain(t),{}
+
+    def _resolve(self, x):
+        f = self.t.encodes
+        g = f[type(x)]
+        if g is None: return None,False
+        retain = anno_ret(g) != NoneType
+        return (g if f.inst is None else types.MethodType(g, self.t)),retain
+
+    def _one(self, x):
+        r = self.cache.get(type(x))
+        if r is None: r = self.cache[type(x)] = self._resolve(x)
+        f,retain = r
+        if f is None: return x
+        return retain_type(f(x), x) if retain else f(x)
+
+    def __call__(self, x, split_idx=None):
+        t = self.t
+        if not self.plain: return t(x, split_idx=split_idx)
+        if split_idx!=t.split_idx and t.split_idx is not None: return x
+        as_item = t.as_item if t.as_item_force is None else t.as_item_force
+        if as_item or not is_listy(x): return self._one(x)
+        return retain_type(tuple(self._one(x_) for x_ in x), x)
+
+class _Plan():
+    "Compiled version of the encodes of `fs`, valid as long as `fs` holds the same transforms and no function is added to a `TypeDispatch`"
+    def __init__(self, fs):
+        # A snapshot, since `fs` can be changed in place
+        self.fs,self.steps,self.version = tuple(fs),[_TfmStep(t) for t in fs],TypeDispatch._version
+        # Runs of steps applied item by item, split at the transforms that override `encode_items`
+        self.runs = []
+        for s in self.steps:
+            if type(s.t).encode_items is not Transform.encode_items: self.runs.append(s.t)
+            elif self.runs and isinstance(self.runs[-1], list): self.runs[-1].append(s)
+            else: self.runs.append([s])
+
+    def valid(self, fs):
+        return self.version==TypeDispatch._version and len(fs)==len(self.fs) and all(a is b for a,b in zip(fs, self.fs))
+
+    def __call__(self, x, split_idx=None, start=0, stop=None):
+        for s in (self.steps if start==0 and stop is None else self.steps[start:stop]): x = s(x, split_idx)
+        return x
+
+    def _run(self, steps, x, split_idx):
+        for s in steps: x = s(x, split_idx)
+        return x
+
+    def encode_items(self, xs, split_idx=None):
+        for r in self.runs:
+            xs = [self._run(r, x, split_idx) for x in xs] if isinstance(r, list) else r.encode_items(xs, split_idx=split_idx)
+        return xs
+
 #Cell
 class Pipeline:
     "A pipeline of composed (for encode/decode) transforms, setup with types"
     def __init__(self, funcs=None, as_item=False, split_idx=None):
-        self.split_idx,self.default = split_idx,None
+        self.split_idx,self.default,self._plan,self.version = split_idx,None,None,0
         if isinstance(funcs, Pipeline): self.fs = funcs.fs
         else:
             if isinstance(funcs, Transform): funcs = [funcs]
@@ -197,11 +269,25 @@ class Pipeline:
     def add(self,t, items=None):
         t.setup(items)
         self.fs.append(t)
+        self._plan,self.version = None,self.version+1
+
+    def _compiled(self):
+        if self._plan is None or not self._plan.valid(self.fs): self._plan = _Plan(self.fs)
+        return self._plan
+
+    def __call__(self, o, start=0, stop=None): return self._compiled()(o, split_idx=self.split_idx, start=start, stop=stop)
+
+    @property
+    def n_det(self):
+        for i,f in enumerate(self.fs):
+            if not f.deterministic: return i
+        return len(self.fs)
 
-    def __call__(self, o): return compose_tfms(o, tfms=self.fs, split_idx=self.split_idx)
+    def encode_items(self, xs): return self._compiled().encode_items(xs, split_idx=self.split_idx)
     def __repr__(self): return f"Pipeline: {self.fs}"
     def __getitem__(self,i): return self.fs[i]
-    def __setstate__(self,data): self.__dict__.update(data)
+    def __getstate__(self): return {k:v for k,v in self.__dict__.items() if k!='_plan'}
+    def __setstate__(self,data): self.__dict__.update({'version':0, **data, '_plan':None})
     def __getattr__(self,k): return gather_attrs(self, k, 'fs')
     def __dir__(self): return super().__dir__() + gather_attr_names(self, 'fs')
 
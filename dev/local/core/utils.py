@@ -4,7 +4,7 @@ __all__ = ['ifnone', 'get_class', 'mk_class', 'wrap_class', 'store_attr', 'attrd
            'class2attr', 'hasattrs', 'tuplify', 'detuplify', 'replicate', 'uniqueify', 'setify', 'merge', 'is_listy',
            'range_of', 'groupby', 'first', 'shufflish', 'IterLen', 'ReindexCollection', 'lt', 'gt', 'le', 'ge', 'eq',
            'ne', 'add', 'sub', 'mul', 'truediv', 'is_', 'is_not', 'Inf', 'true', 'stop', 'gen', 'chunked',
-           'retain_type', 'retain_types', 'show_title', 'ShowTitle', 'Int', 'Float', 'Str', 'num_methods',
+           'retain_type', 'retain_types', 'split_arr', 'show_title', 'ShowTitle', 'Int', 'Float', 'Str', 'num_methods',
            'rnum_methods', 'inum_methods', 'Tuple', 'TupleTitled', 'trace', 'compose', 'maps', 'partialler', 'mapped',
            'instantiate', 'Self', 'Self', 'bunzip', 'join_path_file', 'sort_by_run', 'subplots', 'show_image',
            'show_titled_image', 'show_images', 'ArrayBase', 'ArrayImageBase', 'ArrayImage', 'ArrayImageBW', 'ArrayMask',
@@ -167,9 +167,17 @@ class ReindexCollection(GetAttr, IterLen):
     _default='coll'
     def __init__(self, coll, idxs=None, cache=None):
         self.coll,self.idxs,self.cache = coll,ifnone(idxs,L.range(coll)),cache
+        self._init_get()
+
+    def _init_get(self):
         def _get(self, i): return self.coll[i]
         self._get = types.MethodType(_get,self)
-        if cache is not None: self._get = functools.lru_cache(maxsize=cache)(self._get)
+        if self.cache is not None: self._get = functools.lru_cache(maxsize=self.cache)(self._get)
+
+    def __getstate__(self): return {k:v for k,v in super().__getstate__().items() if k!='_get'}
+    def __setstate__(self, s):
+        self.__dict__.update(s)
+        self._init_get()
 
     def __getitem__(self, i): return self._get(self.idxs[i])
     def __len__(self): return len(self.coll)
@@ -254,8 +262,7 @@ def retain_types(new, old=None, typs=None):
     return type(new)(L(new, old, typs).map_zip(retain_type, cycled=True))
 
 #Cell
-@patch
-def split_arr(df:pd.DataFrame, from_col):
+def split_arr(df, from_col):
     "Split col `from_col` (containing arrays) in `DataFrame` `df` into separate colums"
     col = df[from_col]
     n = len(col.iloc[0])
@@ -263,6 +270,8 @@ def split_arr(df:pd.DataFrame, from_col):
     df[cols] = pd.DataFrame(df[from_col].values.tolist())
     df.drop(columns=from_col, inplace=True)
 
+on_import('pandas', lambda pd: patch_to(pd.DataFrame)(split_arr))
+
 #Cell
 def show_title(o, ax=None, ctx=None, label=None, color='black', **kwargs):
     "Set title of `ax` to `o`, or print `o` if `ax` is `None`"
@@ -512,13 +521,14 @@ def sort_by_run(fs):
     return res
 
 #Cell
-@delegates(plt.subplots, keep=True)
 def subplots(nrows=1, ncols=1, figsize=None, imsize=4, **kwargs):
     if figsize is None: figsize=(imsize*ncols,imsize*nrows)
     fig,ax = plt.subplots(nrows, ncols, figsize=figsize, **kwargs)
     if nrows*ncols==1: ax = array([ax])
     return fig,ax
 
+on_import('matplotlib.pyplot', lambda plt: delegates(plt.subplots, keep=True)(subplots))
+
 #Cell
 def show_image(im, ax=None, figsize=None, title=None, ctx=None, **kwargs):
     "Show a PIL or PyTorch image on `ax`."
@@ -43,7 +43,6 @@ def setup_distrib(gpu=None):
 #Cell
 @delegates()
 class DistributedDL(TfmdDL):
-
     def __init__(self, dataset, rank, world_size, **kwargs):
         super().__init__(dataset, **kwargs)
         if self.n%world_size != 0: self.n += world_size-self.n%world_size
@@ -51,23 +50,23 @@ class DistributedDL(TfmdDL):
         store_attr(self, 'rank,world_size')
 
     def get_idxs(self):
-        idxs = Inf.count if self.indexed else Inf.nones
-        return idxs if self.n is None else list(itertools.islice(idxs, self.total_n))
+        if self.n is None: return Inf.count if self.indexed else Inf.nones
+        return np.arange(self.total_n, dtype=np.int64) if self.indexed else [None]*self.total_n
 
     def shuffle_fn(self, idxs):
         "Deterministically shuffle on each training process based on epoch."
         g = torch.Generator()
         g.manual_seed(self.epoch)
-        return L(idxs)[torch.randperm(self.total_n, generator=g)]
+        perm = torch.randperm(self.total_n, generator=g)
+        return idxs[perm.numpy()] if isinstance(idxs, ndarray) else L(idxs)[perm]
 
     def sample(self):
         idxs = self.get_idxs()
         if self.shuffle: idxs = self.shuffle_fn(idxs)
         # add extra samples to make it evenly divisible
-        idxs += idxs[:(self.total_n - len(idxs))]
+        if len(idxs) < self.total_n: idxs = np.concatenate([idxs, idxs[:self.total_n-len(idxs)]])
         # subsample
-        idxs = idxs[self.rank:self.total_n:self.world_size]
-        return (b for i,b in enumerate(idxs) if i//(self.bs or 1)%self.nw==self.offs)
+        return self.shard(idxs[self.rank:self.total_n:self.world_size])
 
     def create_item(self, s):
         if s is not None and s >= len(self.dataset): s = s%len(self.dataset)
@@ -78,7 +77,9 @@ class DistributedDL(TfmdDL):
     @classmethod
     def from_dl(cls, dl, rank, world_size, **kwargs):
         cur_kwargs = dict(num_workers=dl.fake_l.num_workers, pin_memory=dl.pin_memory, timeout=dl.timeout,
-                          bs=dl.bs, shuffle=dl.shuffle, drop_last=dl.drop_last, indexed=dl.indexed)
+                          bs=dl.bs, shuffle=dl.shuffle, drop_last=dl.drop_last, indexed=dl.indexed, prefetch=dl.prefetch,
+                          persistent_workers=dl.persistent_workers, worker_tfms=dl.worker_tfms, dynamic=dl.dynamic,
+                          in_order=dl.in_order, cache_batches=getattr(dl, 'cache_batches', None))
         cur_kwargs.update({n: getattr(dl, n) for n in cls._methods if n not in "sample shuffle_fn create_item".split()})
         return cls(dl.dataset, rank, world_size, **merge(cur_kwargs, kwargs))
 
@@ -90,11 +91,13 @@ class DistributedTrainer(Callback):
     def begin_fit(self):
         self.learn.model = DistributedDataParallel(self.model, device_ids=[self.cuda_id], output_device=self.cuda_id)
         self.old_dls = [dl for dl in self.dbunch.dls]
-        self.learn.dbunch.dls = [DistributedDL.from_dl(dl, rank_distrib(), num_distrib()) for dl in self.dbunch.dls]
+        # Streaming datasets like `ShardedStream` split themselves between the processes
+        self.learn.dbunch.dls = [DistributedDL.from_dl(dl, rank_distrib(), num_distrib()) if dl.indexed else dl
+                                 for dl in self.dbunch.dls]
         if rank_distrib() > 0: self.learn.logger=noop
 
     def begin_epoch(self):
-        for dl in self.dbunch.dls: dl.set_epoch(self.epoch)
+        for dl in self.dbunch.dls: getattr(dl, 'set_epoch', noop)(self.epoch)
 
     def after_fit(self):
         self.learn.model = self.learn.model.module
@@ -113,27 +113,30 @@ def mk_metric(m):
     return m if isinstance(m, Metric) else AvgMetric(m)
 
 #Cell
-def save_model(file, model, opt, with_opt=True):
-    "Save `model` to `file` along with `opt` (if available, and if `with_opt`)"
+def save_model(file, model, opt, with_opt=True, dl_state=None):
+    "Save `model` to `file` along with `opt` (if available, and if `with_opt`) and `dl_state` (if not `None`)"
     if opt is None: with_opt=False
     state = get_model(model).state_dict()
     if with_opt: state = {'model': state, 'opt':opt.state_dict()}
+    if dl_state is not None: state = {**(state if with_opt else {'model': state}), 'dl':dl_state}
     torch.save(state, file)
 
 #Cell
 def load_model(file, model, opt, with_opt=None, device=None, strict=True):
-    "Load `model` from `file` along with `opt` (if available, and if `with_opt`)"
+    "Load `model` from `file` along with `opt` (if available, and if `with_opt`) and return the `DataLoader` state saved, if any"
     if isinstance(device, int): device = torch.device('cuda', device)
     elif device is None: device = 'cpu'
     state = torch.load(file, map_location=device)
-    hasopt = set(state)=={'model', 'opt'}
-    model_state = state['model'] if hasopt else state
+    wrapped = 'model' in state and set(state) <= {'model', 'opt', 'dl'}
+    hasopt = wrapped and 'opt' in state
+    model_state = state['model'] if wrapped else state
     get_model(model).load_state_dict(model_state, strict=strict)
     if hasopt and ifnone(with_opt,True):
         try: opt.load_state_dict(state['opt'])
         except:
             if with_opt: warn("Could not load the optimizer state.")
     elif with_opt: warn("Saved filed doesn't contain an optimizer state.")
+    return state.get('dl') if wrapped else None
 
 #Cell
 def _try_concat(o):
@@ -142,12 +145,18 @@ def _try_concat(o):
     except:
         return sum([L(o_[i,:] for i in range_of(o_)) for o_ in o], L())
 
+#Cell
+def _cb_handler(cb, event_name):
+    "Function to call for `event_name` on `cb`, or `None` if it doesn't handle it"
+    if type(cb).__call__ is not Callback.__call__: return partial(cb, event_name)
+    return getattr(cb, event_name, None)
+
 #Cell
 class Learner():
     def __init__(self, dbunch, model, loss_func=None, opt_func=Adam, lr=defaults.lr, splitter=trainable_params, cbs=None,
                  cb_funcs=None, metrics=None, path=None, model_dir='models', wd_bn_bias=False, train_bn=True):
         store_attr(self, "dbunch,model,opt_func,lr,splitter,model_dir,wd_bn_bias,train_bn,metrics")
-        self.training,self.logger,self.opt,self.cbs = False,print,None,L()
+        self.training,self.logger,self.opt,self.cbs,self._cb_events = False,print,None,L(),None
         #TODO: infer loss_func from data
         if loss_func is None:
             loss_func = getattr(dbunch.train_ds, 'loss_func', None)
@@ -162,6 +171,10 @@ class Learner():
     def metrics(self): return self._metrics
     @metrics.setter
     def metrics(self,v): self._metrics = L(v).map(mk_metric)
+    @property
+    def cbs(self): return self._cbs
+    @cbs.setter
+    def cbs(self,v): self._cbs,self._cb_events = v,None
 
     def add_cbs(self, cbs): L(cbs).map(self.add_cb)
     def remove_cbs(self, cbs): L(cbs).map(self.remove_cb)
@@ -171,12 +184,14 @@ class Learner():
         cb.learn = self
         setattr(self, cb.name, cb)
         self.cbs.append(cb)
+        self._cb_events = None
         return self
 
     def remove_cb(self, cb):
         cb.learn = None
         if hasattr(self, cb.name): delattr(self, cb.name)
         if cb in self.cbs: self.cbs.remove(cb)
+        self._cb_events = None
 
     @contextmanager
     def added_cbs(self, cbs):
@@ -184,12 +199,21 @@ class Learner():
         yield
         self.remove_cbs(cbs)
 
-    def ordered_cbs(self, cb_func:str): return [cb for cb in sort_by_run(self.cbs) if hasattr(cb, cb_func)]
+    def ordered_cbs(self, cb_func:str): return [cb for cb,_ in self.cb_events.get(cb_func, [])]
 
-    def __call__(self, event_name): L(event_name).map(self._call_one)
+    @property
+    def cb_events(self):
+        if self._cb_events is None:
+            cbs = sort_by_run(self.cbs)
+            self._cb_events = {e:[(cb,f) for cb in cbs for f in [_cb_handler(cb, e)] if f is not None] for e in _events}
+        return self._cb_events
+
+    def __call__(self, event_name):
+        if isinstance(event_name, str): return self._call_one(event_name)
+        for e in event_name: self._call_one(e)
     def _call_one(self, event_name):
         assert hasattr(event, event_name)
-        [cb(event_name) for cb in sort_by_run(self.cbs)]
+        for _,f in self.cb_events[event_name]: f()
 
     def _bn_bias_state(self, with_bias): return bn_bias_params(self.model, with_bias).map(self.opt.state)
     def create_opt(self):
@@ -317,16 +341,21 @@ class Learner():
         if hasattr(self.loss_func, 'reduction'): return replacing_yield(self.loss_func, 'reduction', 'none')
         else: return replacing_yield(self, 'loss_func', partial(self.loss_func, reduction='none'))
 
-    def save(self, file, with_opt=True):
+    def save(self, file, with_opt=True, with_dl=False):
         if rank_distrib(): return # don't save if slave proc
         file = join_path_file(file, self.path/self.model_dir, ext='.pth')
-        save_model(file, self.model, getattr(self,'opt',None), with_opt)
+        dl_state = [dl.state_dict() for dl in self.dbunch.dls] if with_dl else None
+        save_model(file, self.model, getattr(self,'opt',None), with_opt, dl_state=dl_state)
 
-    def load(self, file, with_opt=None, device=None, strict=True):
+    def load(self, file, with_opt=None, device=None, strict=True, with_dl=False):
         if device is None: device = self.dbunch.device
         if self.opt is None: self.create_opt()
         file = join_path_file(file, self.path/self.model_dir, ext='.pth')
-        load_model(file, self.model, self.opt, with_opt=with_opt, device=device, strict=strict)
+        dl_state = load_model(file, self.model, self.opt, with_opt=with_opt, device=device, strict=strict)
+        if with_dl:
+            if dl_state is None: warn("Saved file doesn't contain a DataLoader state.")
+            else:
+                for dl,s in zip(self.dbunch.dls, dl_state): dl.load_state_dict(s)
         return self
 
 Learner.x,Learner.y = add_props(lambda i,x: detuplify((x.xb,x.yb)[i]))
@@ -339,6 +368,7 @@ add_docs(Learner, "Group together a `model`, some `dbunch` and a `loss_func` to
     remove_cb="Add `cb` from the list of `Callback` and deregister `self` as their learner",
     added_cbs="Context manage that temporarily adds `cbs`",
     ordered_cbs="Return a list of `Callback` for one step `cb_func` in the training loop",
+    cb_events="Dictionary mapping each event to the `(callback, function to call)` that handle it, in order",
     create_opt="Create an optimizer with `lr`",
     one_batch="Train or evaluate `self.model` on batch `(xb,yb)`",
     all_batches="Train or evaluate `self.model` on all batches of `self.dl`",
@@ -350,8 +380,8 @@ add_docs(Learner, "Group together a `model`, some `dbunch` and a `loss_func` to
     show_training_loop="Show each step in the training loop",
     no_logging="Context manager to temporarily remove `logger`",
     loss_not_reduced="A context manager to evaluate `loss_func` with reduction set to none.",
-    save="Save model and optimizer state (if `with_opt`) to `self.path/self.model_dir/file`",
-    load="Load model and optimizer state (if `with_opt`) from `self.path/self.model_dir/file` using `device`"
+    save="Save model and optimizer state (if `with_opt`), and the state of the `DataLoader`s (if `with_dl`) to `self.path/self.model_dir/file`",
+    load="Load model and optimizer state (if `with_opt`), and the state of the `DataLoader`s (if `with_dl`) from `self.path/self.model_dir/file` using `device`"
 )
 
 #Cell
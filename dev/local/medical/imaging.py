@@ -9,7 +9,7 @@ from ..test import *
 from ..basics import *
 from ..vision.all import *
 
-import pydicom,kornia,skimage
+import pydicom
 from pydicom.dataset import Dataset as DcmDataset
 from pydicom.tag import BaseTag as DcmTag
 from pydicom.multival import MultiValue as DcmMultiValue
@@ -125,7 +125,7 @@ class PILCTScan(PILBase): _open_args,_tensor_cls,_show_args = {},TensorCTScan,Te
 #Cell
 @patch
 @delegates(show_image)
-def show(self:DcmDataset, scale=True, cmap=plt.cm.bone, min_px=-1100, max_px=None, **kwargs):
+def show(self:DcmDataset, scale=True, cmap='bone', min_px=-1100, max_px=None, **kwargs):
     px = (self.windowed(*scale) if isinstance(scale,tuple)
           else self.hist_scaled(min_px=min_px,max_px=max_px,brks=scale) if isinstance(scale,(ndarray,Tensor))
           else self.hist_scaled(min_px=min_px,max_px=max_px) if scale
@@ -318,4 +318,4 @@ def _dcm2dict(fn, **kwargs): return fn.dcmread().as_dict(**kwargs)
 @delegates(parallel)
 def _from_dicoms(cls, fns, n_workers=0, **kwargs):
     return pd.DataFrame(parallel(_dcm2dict, fns, n_workers=n_workers, **kwargs))
-pd.DataFrame.from_dicoms = classmethod(_from_dicoms)
\ No newline at end of file
+on_import('pandas', lambda pd: setattr(pd.DataFrame, 'from_dicoms', classmethod(_from_dicoms)))
\ No newline at end of file
@@ -2,7 +2,8 @@
 
 __all__ = ['Optimizer', 'sgd_step', 'weight_decay', 'l2_reg', 'average_grad', 'average_sqr_grad', 'momentum_step',
            'SGD', 'rms_prop_step', 'RMSProp', 'step_stat', 'debias', 'adam_step', 'Adam', 'larc_layer_lr', 'larc_step',
-           'Larc', 'lamb_step', 'Lamb', 'detuplify_pg', 'set_item_pg', 'pytorch_hp_map', 'OptimWrapper']
+           'Larc', 'lamb_step', 'Lamb', 'sgd_fused', 'rms_prop_fused', 'adam_fused', 'larc_fused', 'lamb_fused',
+           'detuplify_pg', 'set_item_pg', 'pytorch_hp_map', 'OptimWrapper']
 
 #Cell
 from .torch_basics import *
@@ -45,7 +46,7 @@ class _BaseOptimizer():
 class Optimizer(_BaseOptimizer):
     "Base optimizer class for the fastai library, updating `params` with `steppers`"
     _keep_on_clear = ['force_train', 'do_wd']
-    def __init__(self, params, steppers, stats=None, train_bn=True, **defaults):
+    def __init__(self, params, steppers, stats=None, train_bn=True, fused=None, **defaults):
         params = L(params)
         self.steppers,self.stats,self.state,self.train_bn = L(steppers),L(stats),defaultdict(dict),train_bn
         defaults = merge(*self.stats.attrgot('defaults'), *self.steppers.attrgot('defaults'), defaults)
@@ -53,19 +54,29 @@ class Optimizer(_BaseOptimizer):
         #self.step_func = compose(*steppers)
         self.hypers = L({} for _ in range_of(self.param_groups))
         self.set_hypers(**defaults)
-        self.frozen_idx = 0
+        self.frozen_idx,self.fused = 0,fused
 
-    def zero_grad(self):
-        for p,*_ in self.all_params(with_grad=True):
-            p.grad.detach_()
-            p.grad.zero_()
+    def zero_grad(self, set_to_none=False):
+        for pg in self.param_groups:
+            for p in pg:
+                if p.grad is None: continue
+                if set_to_none: p.grad = None
+                else:
+                    p.grad.detach_()
+                    p.grad.zero_()
 
     def step(self):
+        if self.fused is not None: return self._fused_step()
         for p,pg,state,hyper in self.all_params(with_grad=True):
             for stat in self.stats:    state = stat(state, p, **hyper)
             for step in self.steppers: step(p, **{**state, **hyper})
             self.state[p] = state
 
+    def _fused_step(self):
+        for pg,hyper in zip(self.param_groups,self.hypers):
+            ps = [p for p in pg if p.grad is not None]
+            if ps: self.fused(ps, [self.state[p] for p in ps], **hyper)
+
     def clear_state(self):
         for p,pg,state,hyper in self.all_params():
             self.state[p] = {k: state[k] for k in self._keep_on_clear if k in state}
@@ -125,12 +136,13 @@ def momentum_step(p, lr, grad_avg, **kwargs):
     return p
 
 #Cell
-def SGD(params, lr, mom=0., wd=0., decouple_wd=True):
+def SGD(params, lr, mom=0., wd=0., decouple_wd=True, fused=False):
     "A `Optimizer` for SGD with `lr` and `mom` and `params`"
     steppers = [weight_decay] if decouple_wd else [l2_reg]
     steppers.append(sgd_step if mom==0 else momentum_step)
-    if mom == 0.: return Optimizer(params, steppers, lr=lr, wd=wd)
-    else: return Optimizer(params, steppers, stats=average_grad, lr=lr, mom=mom, wd=wd)
+    fused = partial(sgd_fused, momentum=mom!=0, decouple_wd=decouple_wd) if fused else None
+    if mom == 0.: return Optimizer(params, steppers, lr=lr, wd=wd, fused=fused)
+    else: return Optimizer(params, steppers, stats=average_grad, lr=lr, mom=mom, wd=wd, fused=fused)
 
 #Cell
 def rms_prop_step(p, lr, sqr_avg, eps, grad_avg=None, **kwargs):
@@ -142,12 +154,13 @@ def rms_prop_step(p, lr, sqr_avg, eps, grad_avg=None, **kwargs):
 rms_prop_step.defaults = dict(eps=1e-8)
 
 #Cell
-def RMSProp(params, lr, sqr_mom=0.99, mom=0., wd=0., decouple_wd=True):
+def RMSProp(params, lr, sqr_mom=0.99, mom=0., wd=0., decouple_wd=True, fused=False):
     "A `Optimizer` for RMSProp with `lr`, `sqr_mom`, `mom` and `params`"
     steppers = [weight_decay] if decouple_wd else [l2_reg]
     steppers.append(rms_prop_step)
     stats = [average_sqr_grad] if mom==0. else [average_grad, average_sqr_grad]
-    return Optimizer(params, steppers, stats=stats, lr=lr, mom=mom, sqr_mom=sqr_mom, wd=wd)
+    fused = partial(rms_prop_fused, momentum=mom!=0., decouple_wd=decouple_wd) if fused else None
+    return Optimizer(params, steppers, stats=stats, lr=lr, mom=mom, sqr_mom=sqr_mom, wd=wd, fused=fused)
 
 #Cell
 def step_stat(state, p, **kwargs):
@@ -170,12 +183,13 @@ def adam_step(p, lr, mom, step, sqr_mom, grad_avg, sqr_avg, eps, **kwargs):
 adam_step._defaults = dict(eps=1e-5)
 
 #Cell
-def Adam(params, lr, mom=0.9, sqr_mom=0.99, eps=1e-5, wd=0., decouple_wd=True):
+def Adam(params, lr, mom=0.9, sqr_mom=0.99, eps=1e-5, wd=0., decouple_wd=True, fused=False):
     "A `Optimizer` for Adam with `lr`, `mom`, `sqr_mom`, `eps` and `params`"
     steppers = [weight_decay] if decouple_wd else [l2_reg]
     steppers.append(adam_step)
     stats = [partial(average_grad, dampening=True), average_sqr_grad, step_stat]
-    return Optimizer(params, steppers, stats=stats, lr=lr, mom=mom, sqr_mom=sqr_mom, eps=eps, wd=wd)
+    fused = partial(adam_fused, decouple_wd=decouple_wd) if fused else None
+    return Optimizer(params, steppers, stats=stats, lr=lr, mom=mom, sqr_mom=sqr_mom, eps=eps, wd=wd, fused=fused)
 
 #Cell
 def larc_layer_lr(state, p, lr, trust_coeff, wd, eps, clip=True, **kwargs):
@@ -193,13 +207,14 @@ def larc_step(p, local_lr, grad_avg=None, **kwargs):
     return p
 
 #Cell
-def Larc(params, lr, mom=0.9, clip=True, trust_coeff=0.02, eps=1e-8, wd=0., decouple_wd=True):
+def Larc(params, lr, mom=0.9, clip=True, trust_coeff=0.02, eps=1e-8, wd=0., decouple_wd=True, fused=False):
     "A `Optimizer` for Adam with `lr`, `mom`, `sqr_mom`, `eps` and `params`"
     steppers = [weight_decay] if decouple_wd else [l2_reg]
     steppers.append(larc_step)
     stats = [] if mom==0. else [average_grad]
     stats.append(partial(larc_layer_lr, clip=clip))
-    return Optimizer(params, steppers, stats=stats, lr=lr, mom=mom, trust_coeff=trust_coeff, eps=eps, wd=wd)
+    fused = partial(larc_fused, momentum=mom!=0., clip=clip, decouple_wd=decouple_wd) if fused else None
+    return Optimizer(params, steppers, stats=stats, lr=lr, mom=mom, trust_coeff=trust_coeff, eps=eps, wd=wd, fused=fused)
 
 #Cell
 def lamb_step(p, lr, mom, step, sqr_mom, grad_avg, sqr_avg, eps, **kwargs):
@@ -215,12 +230,117 @@ def lamb_step(p, lr, mom, step, sqr_mom, grad_avg, sqr_avg, eps, **kwargs):
 lamb_step._defaults = dict(eps=1e-6, wd=0.)
 
 #Cell
-def Lamb(params, lr, mom=0.9, sqr_mom=0.99, eps=1e-5, wd=0., decouple_wd=True):
+def Lamb(params, lr, mom=0.9, sqr_mom=0.99, eps=1e-5, wd=0., decouple_wd=True, fused=False):
     "A `Optimizer` for Adam with `lr`, `mom`, `sqr_mom`, `eps` and `params`"
     steppers = [weight_decay] if decouple_wd else [l2_reg]
     steppers.append(lamb_step)
     stats = [partial(average_grad, dampening=True), average_sqr_grad, step_stat]
-    return Optimizer(params, steppers, stats=stats, lr=lr, mom=mom, sqr_mom=sqr_mom, eps=eps, wd=wd)
+    fused = partial(lamb_fused, decouple_wd=decouple_wd) if fused else None
+    return Optimizer(params, steppers, stats=stats, lr=lr, mom=mom, sqr_mom=sqr_mom, eps=eps, wd=wd, fused=fused)
+
+#Cell
+def _foreach(op, ts, *args, **kwargs):
+    "Apply `op` to all tensors in `ts` (with `torch._foreach_{op}` if it exists), broadcasting non-list `args`"
+    if not ts: return []
+    f = getattr(torch, f'_foreach_{op}', None)
+    if f is not None: return f(ts, *args, **kwargs)
+    args = [a if isinstance(a, list) else itertools.repeat(a) for a in args]
+    return [getattr(t, op)(*a, **kwargs) for t,*a in zip(ts, *args)]
+
+#Cell
+def _data_grads(ps): return [p.data for p in ps],[p.grad.data for p in ps]
+
+def _wd_fused(ds, gs, states, lr, wd, decouple_wd=True):
+    "`weight_decay` (or `l2_reg` if not `decouple_wd`) on all `ds` with `do_wd`"
+    if wd==0: return
+    idx = [i for i,s in enumerate(states) if s.get('do_wd', True)]
+    if decouple_wd: _foreach('mul_', [ds[i] for i in idx], 1 - lr*wd)
+    else: _foreach('add_', [gs[i] for i in idx], [ds[i] for i in idx], alpha=wd)
+
+def _avg_fused(states, gs, key, mom, dampening, sqr=False):
+    "`average_grad` (or `average_sqr_grad` if `sqr`) of all `gs` in `states[key]`"
+    for s,g in zip(states,gs):
+        if key not in s: s[key] = torch.zeros_like(g)
+    avgs = [s[key] for s in states]
+    damp = 1-mom if dampening else 1.
+    _foreach('mul_', avgs, mom)
+    if sqr: _foreach('addcmul_', avgs, gs, gs, value=damp)
+    else:   _foreach('add_', avgs, gs, alpha=damp)
+    return avgs
+
+def _step_fused(states):
+    "`step_stat` on all `states`, returning their indices grouped by step"
+    res = defaultdict(list)
+    for i,s in enumerate(states):
+        s['step'] = s.get('step', 0) + 1
+        res[s['step']].append(i)
+    return res
+
+#Cell
+def sgd_fused(ps, states, lr, wd, mom=0., momentum=False, decouple_wd=True, **kwargs):
+    "Fused step for `SGD` on all `ps`"
+    ds,gs = _data_grads(ps)
+    if momentum: avgs = _avg_fused(states, gs, 'grad_avg', mom, False)
+    _wd_fused(ds, gs, states, lr, wd, decouple_wd)
+    _foreach('add_', ds, avgs if momentum else gs, alpha=-lr)
+
+#Cell
+def rms_prop_fused(ps, states, lr, sqr_mom, eps, wd, mom=0., momentum=False, decouple_wd=True, **kwargs):
+    "Fused step for `RMSProp` on all `ps`"
+    ds,gs = _data_grads(ps)
+    if momentum: avgs = _avg_fused(states, gs, 'grad_avg', mom, False)
+    sqrs = _avg_fused(states, gs, 'sqr_avg', sqr_mom, True, sqr=True)
+    _wd_fused(ds, gs, states, lr, wd, decouple_wd)
+    denom = _foreach('sqrt', sqrs)
+    _foreach('add_', denom, eps)
+    _foreach('addcdiv_', ds, avgs if momentum else gs, denom, value=-lr)
+
+#Cell
+def adam_fused(ps, states, lr, mom, sqr_mom, eps, wd, decouple_wd=True, **kwargs):
+    "Fused step for `Adam` on all `ps`"
+    ds,gs = _data_grads(ps)
+    avgs = _avg_fused(states, gs, 'grad_avg', mom, True)
+    sqrs = _avg_fused(states, gs, 'sqr_avg', sqr_mom, True, sqr=True)
+    steps = _step_fused(states)
+    _wd_fused(ds, gs, states, lr, wd, decouple_wd)
+    for step,idx in steps.items():
+        debias1 = debias(mom,     1-mom,     step)
+        debias2 = debias(sqr_mom, 1-sqr_mom, step)
+        denom = _foreach('div', [sqrs[i] for i in idx], debias2)
+        _foreach('sqrt_', denom)
+        _foreach('add_', denom, eps)
+        _foreach('addcdiv_', [ds[i] for i in idx], [avgs[i] for i in idx], denom, value=-lr / debias1)
+
+#Cell
+def larc_fused(ps, states, lr, trust_coeff, eps, wd, mom=0., momentum=False, clip=True, decouple_wd=True, **kwargs):
+    "Fused step for `Larc` on all `ps`"
+    ds,gs = _data_grads(ps)
+    avgs = _avg_fused(states, gs, 'grad_avg', mom, False) if momentum else [None]*len(ps)
+    for p,s in zip(ps,states): larc_layer_lr(s, p, lr, trust_coeff, wd, eps, clip=clip)
+    _wd_fused(ds, gs, states, lr, wd, decouple_wd)
+    for p,s,a in zip(ps,states,avgs): larc_step(p, s['local_lr'], a)
+
+#Cell
+def lamb_fused(ps, states, lr, mom, sqr_mom, eps, wd, decouple_wd=True, **kwargs):
+    "Fused step for `Lamb` on all `ps`"
+    ds,gs = _data_grads(ps)
+    avgs = _avg_fused(states, gs, 'grad_avg', mom, True)
+    sqrs = _avg_fused(states, gs, 'sqr_avg', sqr_mom, True, sqr=True)
+    steps = _step_fused(states)
+    _wd_fused(ds, gs, states, lr, wd, decouple_wd)
+    for step,idx in steps.items():
+        debias1 = debias(mom,     1-mom,     step)
+        debias2 = debias(sqr_mom, 1-sqr_mom, step)
+        denom = _foreach('div', [sqrs[i] for i in idx], debias2)
+        _foreach('sqrt_', denom)
+        _foreach('add_', denom, eps)
+        upds = _foreach('div', [avgs[i] for i in idx], debias1)
+        _foreach('div_', upds, denom)
+        #The trust ratio and the step use a different scale per parameter, computed as in `lamb_step`
+        for i,u in zip(idx,upds):
+            r1,r2 = ds[i].pow(2).mean().sqrt(),u.pow(2).mean().sqrt()
+            q = 1 if r1 == 0 or r2 == 0 else min(r1/r2,10)
+            ds[i].add_(u, alpha=-lr * q)
 
 #Cell
 def detuplify_pg(d):
@@ -10,7 +10,7 @@ from ..core import *
 from ..data.all import *
 
 #Cell
-pd.set_option('mode.chained_assignment','raise')
+on_import('pandas', lambda pd: pd.set_option('mode.chained_assignment','raise'))
 
 #Cell
 class _TabIloc:
@@ -153,11 +153,17 @@ def show_batch(x: Tabular, y, samples, max_n=10, ctxs=None):
 #Cell
 @delegates()
 class TabDataLoader(TfmdDL):
-    do_item = noops
     def __init__(self, dataset, bs=16, shuffle=False, after_batch=None, num_workers=0, **kwargs):
         after_batch = L(after_batch)+ReadTabBatch(dataset)
         super().__init__(dataset, bs=bs, shuffle=shuffle, after_batch=after_batch, num_workers=num_workers, **kwargs)
 
-    def create_batch(self, b): return self.dataset.iloc[b]
+    def create_items(self, b): return self.dataset.iloc[b]
+    # The rows of a batch are fetched at once, as a `Tabular`: there is no per-item work
+    def do_items(self, b): return self.create_items(b)
+    def create_batch(self, b): return b
+    def create_batches(self, samps):
+        # Each `Tabular` is a whole batch, not a list of items to re-chunk
+        if not isinstance(samps, ndarray): samps = array(list(samps), dtype=np.int64)
+        return map(self.do_batch, map(self.do_items, self.batch_idxs(samps)))
 
 TabularPandas._dl_type = TabDataLoader
\ No newline at end of file
@@ -1,7 +1,8 @@
 #AUTOGENERATED! DO NOT EDIT! File to edit: dev/00_test.ipynb (unless otherwise specified).
 
 __all__ = ['test_fail', 'test', 'nequals', 'test_eq', 'test_eq_type', 'test_ne', 'is_close', 'test_close', 'test_is',
-           'test_shuffled', 'test_stdout', 'test_warns', 'TEST_IMAGE', 'TEST_IMAGE_BW', 'test_fig_exists']
+           'test_shuffled', 'test_stdout', 'test_warns', 'TEST_IMAGE', 'TEST_IMAGE_BW', 'test_fig_exists',
+           'import_times']
 
 #Cell
 from .core.imports import *
@@ -93,4 +94,16 @@ TEST_IMAGE_BW = 'images/mnist3.png'
 #Cell
 def test_fig_exists(ax):
     "Test there is a figure displayed in `ax`"
-    assert ax and len(np.frombuffer(ax.figure.canvas.tostring_argb(), dtype=np.uint8))
\ No newline at end of file
+    assert ax and len(np.frombuffer(ax.figure.canvas.tostring_argb(), dtype=np.uint8))
+
+#Cell
+def import_times(mod):
+    "Import `mod` in a new process with `-X importtime` and return `{module: (self, cumulative)}` import times in seconds"
+    res = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {mod}'], stderr=subprocess.PIPE, universal_newlines=True)
+    assert res.returncode==0, res.stderr
+    times = {}
+    for l in res.stderr.splitlines():
+        if not l.startswith('import time:') or 'self [us]' in l: continue
+        slf,cum,name = l[len('import time:'):].split('|')
+        times[name.strip()] = (int(slf)/1e6, int(cum)/1e6)
+    return times
\ No newline at end of file
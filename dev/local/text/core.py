@@ -13,8 +13,7 @@ from ..core import *
 from ..data.all import *
 
 #Cell
-import spacy,html
-from spacy.symbols import ORTH
+import html
 
 #Cell
 #special tokens
@@ -113,7 +112,7 @@ class SpacyTokenizer():
     def __init__(self, lang='en', special_toks=None, buf_sz=5000):
         special_toks = ifnone(special_toks, defaults.text_spec_tok)
         nlp = spacy.blank(lang, disable=["parser", "tagger", "ner"])
-        for w in special_toks: nlp.tokenizer.add_special_case(w, [{ORTH: w}])
+        for w in special_toks: nlp.tokenizer.add_special_case(w, [{spacy.symbols.ORTH: w}])
         self.pipe,self.buf_sz = nlp.pipe,buf_sz
 
     def __call__(self, items):
@@ -147,10 +146,10 @@ fn_counter_pkl = 'counter.pkl'
 
 #Cell
 def tokenize_folder(path, extensions=None, folders=None, output_dir=None, n_workers=defaults.cpus,
-                    rules=None, tok_func=SpacyTokenizer, encoding='utf8', **tok_kwargs):
+                    rules=None, tok_func=SpacyTokenizer, encoding='utf8', index=False, **tok_kwargs):
     "Tokenize text files in `path` in parallel using `n_workers`"
     path,extensions = Path(path),ifnone(extensions, ['.txt'])
-    fnames = get_files(path, extensions=extensions, recurse=True, folders=folders)
+    fnames = get_files(path, extensions=extensions, recurse=True, folders=folders, index=index)
     output_dir = Path(ifnone(output_dir, path.parent/f'{path.name}_tok'))
     rules = partial(Path.read, encoding=encoding) + L(ifnone(rules, defaults.text_proc_rules.copy()))
 
@@ -99,33 +99,39 @@ def pad_input(samples, pad_idx=1, pad_first=False, backwards=False):
 #Cell
 def _default_sort(x): return len(x[0])
 
+def _ranks(keys):
+    "Rank of each of `keys` (equal keys have the same), numbers or tuples of numbers compared lexicographically"
+    a = array(keys)
+    if a.ndim==1: return np.unique(a, return_inverse=True)[1]
+    return np.unique(a, axis=0, return_inverse=True)[1].reshape(-1)
+
 @delegates(TfmdDL)
 class SortedDL(TfmdDL):
     def __init__(self, dataset, sort_func=None, res=None, **kwargs):
         super().__init__(dataset, **kwargs)
         self.sort_func = _default_sort if sort_func is None else sort_func
         self.res = [self.sort_func(self.do_item(i)) for i in range_of(self.dataset)] if res is None else res
-        self.idx_max = np.argmax(self.res)
+        # Sorting the ranks of the keys works with tuple keys too
+        self._ranks = _ranks(self.res)
+        self.idx_max = np.argmax(self._ranks)
+
+    def _sorted(self, idxs): return idxs[np.argsort(-self._ranks[idxs], kind='stable')]
 
     def get_idxs(self):
         idxs = super().get_idxs()
-        if self.shuffle: return idxs
-        return sorted(idxs, key=lambda i: self.res[i], reverse=True)
+        return idxs if self.shuffle else self._sorted(idxs)
 
     def shuffle_fn(self,idxs):
-        idxs = np.random.permutation(len(self.dataset))
-        idx_max = np.extract(idxs==self.idx_max, idxs)[0]
-        idxs[0],idxs[idx_max] = idxs[idx_max],idxs[0]
+        rng = self.np_rng()
+        idxs = rng.permutation(idxs)
+        # put the longest item in the first batch, to get OOM errors right away
+        i = np.flatnonzero(idxs==self.idx_max)[0]
+        idxs[[0,i]] = idxs[[i,0]]
         sz = self.bs*50
-        chunks = [idxs[i:i+sz] for i in range(0, len(idxs), sz)]
-        chunks = [sorted(s, key=lambda i: self.res[i], reverse=True) for s in chunks]
-        sort_idx = np.concatenate(chunks)
-
-        sz = self.bs
-        batches = [sort_idx[i:i+sz] for i in range(0, len(sort_idx), sz)]
-        sort_idx = np.concatenate(np.random.permutation(batches[1:-1])) if len(batches) > 2 else np.array([],dtype=np.int)
-        sort_idx = np.concatenate((batches[0], sort_idx) if len(batches)==1 else (batches[0], sort_idx, batches[-1]))
-        return iter(sort_idx)
+        sort_idx = np.concatenate([self._sorted(c) for c in np.split(idxs, range(sz, len(idxs), sz))])
+        batches = np.split(sort_idx, range(self.bs, len(sort_idx), self.bs))
+        if len(batches) <= 2: return sort_idx
+        return np.concatenate([batches[0], *[batches[i+1] for i in rng.permutation(len(batches)-2)], batches[-1]])
 
 #Cell
 def TextBlock(vocab=None, is_lm=False):
@@ -72,6 +72,22 @@ def unsqueeze_(x, dim=-1, n=1):
 def _fa_rebuild_tensor (cls, *args, **kwargs): return cls(torch._utils._rebuild_tensor_v2(*args, **kwargs))
 def _fa_rebuild_qtensor(cls, *args, **kwargs): return cls(torch._utils._rebuild_qtensor  (*args, **kwargs))
 
+#Cell
+from multiprocessing.reduction import ForkingPickler
+from torch.multiprocessing.reductions import reduce_tensor
+
+def _as_subclass(t, cls): return t.as_subclass(cls) if hasattr(t, 'as_subclass') else torch.Tensor._make_subclass(cls, t)
+
+def _rebuild_tb(cls, meta, f, args):
+    res = f(*args)
+    if type(res) is not cls: res = _as_subclass(res, cls)
+    res._meta = meta
+    return res
+
+def _reduce_tb(t):
+    "Reduce `t` with PyTorch's shared memory reduction, restoring its type and `_meta` on arrival"
+    return (_rebuild_tb, (type(t), getattr(t, '_meta', {}), *reduce_tensor(t)))
+
 #Cell
 def apply(func, x, *args, **kwargs):
     "Apply `func` recursively to `x`, passing on args"
@@ -146,29 +162,53 @@ class TensorBase(Tensor):
         res = self[i]
         return type(self)(res) if isinstance(res,Tensor) else res
 
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        ForkingPickler.register(cls, _reduce_tb)
+
+ForkingPickler.register(TensorBase, _reduce_tb)
+
+#Cell
+def _tb_wrap(res, cls, meta):
+    "Cast the plain tensors in `res` to `cls`, sharing the `_meta` dict `meta`"
+    if isinstance(res, (tuple,list)): return type(res)(_tb_wrap(o, cls, meta) for o in res)
+    if type(res) is not Tensor: return res
+    res = _as_subclass(res, cls)
+    res._meta = meta
+    return res
+
+def _tb_torch_function(cls, func, types, args=(), kwargs=None):
+    with torch._C.DisableTorchFunction(): res = func(*args, **ifnone(kwargs, {}))
+    # Other functions, like `F.conv2d` in a model, return plain tensors
+    if func not in _tb_methods or not isinstance(args[0], TensorBase): return res
+    return _tb_wrap(res, type(args[0]), getattr(args[0], '_meta', {}))
+
 #Cell
+def _tb_method_names():
+    "Names of the methods and operators of `Tensor` whose results keep the type of a `TensorBase`"
+    t = tensor([1])
+    skips = '__getitem__ __class__ __deepcopy__ __delattr__ __dir__ __doc__ __getattribute__ __hash__ __init__ \
+        __init_subclass__ __new__ __reduce__ __reduce_ex__ __module__ __setstate__ __torch_function__'.split()
+    types = (MethodWrapperType, BuiltinFunctionType, BuiltinMethodType, MethodType, FunctionType)
+    return [fn for fn in dir(t) if fn not in skips and isinstance(getattr(t, fn), types)]
+
 def _patch_tb():
     if getattr(TensorBase,'_patched',False): return
     TensorBase._patched = True
 
     def get_f(fn):
         def _f(self, *args, **kwargs):
-            cls = self.__class__
             res = getattr(super(TensorBase, self), fn)(*args, **kwargs)
-            return cls(res) if isinstance(res,Tensor) else res
+            return _tb_wrap(res, type(self), self._meta)
         return _f
 
-    t = tensor([1])
-    skips = '__getitem__ __class__ __deepcopy__ __delattr__ __dir__ __doc__ __getattribute__ __hash__ __init__ \
-        __init_subclass__ __new__ __reduce__ __reduce_ex__ __module__ __setstate__'.split()
-
-    for fn in dir(t):
-        if fn in skips: continue
-        f = getattr(t, fn)
-        if isinstance(f, (MethodWrapperType, BuiltinFunctionType, BuiltinMethodType, MethodType, FunctionType)):
-            setattr(TensorBase, fn, get_f(fn))
+    for fn in _tb_method_names(): setattr(TensorBase, fn, get_f(fn))
 
-_patch_tb()
+if hasattr(torch._C, 'DisableTorchFunction'):
+    _tb_nowrap = set(getattr(torch.overrides, 'get_default_nowrap_functions', set)())
+    _tb_methods = {getattr(Tensor, fn) for fn in _tb_method_names()} - _tb_nowrap
+    TensorBase.__torch_function__ = classmethod(_tb_torch_function)
+else: _patch_tb()
 
 #Cell
 class TensorCategory(TensorBase): pass
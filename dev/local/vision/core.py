@@ -66,6 +66,7 @@ class PILBase(Image.Image, metaclass=BypassNewMeta):
     _show_args = {'cmap':'viridis'}
     _open_args = {'mode': 'RGB'}
     @classmethod
+    @deterministic
     def create(cls, fn, **kwargs)->None:
         "Open an `Image` from path `fn`"
         if isinstance(fn,Tensor): fn = fn.numpy()
@@ -126,16 +127,14 @@ def get_annotations(fname, prefix=None):
     return [id2images[k] for k in ids], [(id2bboxes[k], id2cats[k]) for k in ids]
 
 #Cell
-from matplotlib import patches, patheffects
-
 def _draw_outline(o, lw):
-    o.set_path_effects([patheffects.Stroke(linewidth=lw, foreground='black'), patheffects.Normal()])
+    o.set_path_effects([matplotlib.patheffects.Stroke(linewidth=lw, foreground='black'), matplotlib.patheffects.Normal()])
 
 def _draw_rect(ax, b, color='white', text=None, text_size=14, hw=True, rev=False):
     lx,ly,w,h = b
     if rev: lx,ly,w,h = ly,lx,h,w
     if not hw: w,h = w-lx,h-ly
-    patch = ax.add_patch(patches.Rectangle((lx,ly), w, h, fill=False, edgecolor=color, lw=2))
+    patch = ax.add_patch(matplotlib.patches.Rectangle((lx,ly), w, h, fill=False, edgecolor=color, lw=2))
     _draw_outline(patch, 4)
     if text is not None:
         patch = ax.text(lx,ly, text, verticalalignment='top', color=color, fontsize=text_size, weight='bold')